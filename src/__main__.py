@@ -10,22 +10,40 @@ from utils import wrapped_message, type_ok, empty_list, choice_check
 # Save the original input function
 original_input = builtins.input
 
+class ReturnToMainMenu(Exception):
+    """Raised by custom_input when the user types 'x', and caught by the main menu loop."""
+
+
 def custom_input(prompt: str) -> str:
     """Custom input function that returns to the main menu if the user types 'x'."""
     user_input = original_input(prompt).strip().lower()
     if user_input == 'x':
         print("Returning to main menu...")
-        main_menu()
+        raise ReturnToMainMenu()
     return user_input
 
 # Override the built-in input function
 builtins.input = custom_input
 
 
+# Set by saving() and cleared once habits and decorations are written to disk
+unsaved_changes = False
+
+
 def saving():
-    """Save the current state of habits and decorations to their respective JSON files."""
+    """Mark habits and decorations as changed; they are written by save_changes() on the way back to the main menu."""
+    global unsaved_changes
+    unsaved_changes = True
+
+
+def save_changes():
+    """Save the current state of habits and decorations to their respective JSON files if anything changed."""
+    global unsaved_changes
+    if not unsaved_changes:
+        return
     FileManager.save_data('habits.json', Conversion.serialize_habits(habit_objects))
-    FileManager.save_data('decorations.json', [decor.__dict__ for decor in decor_objects])
+    FileManager.save_data('decorations.json', [decor.to_json() for decor in decor_objects])
+    unsaved_changes = False
 
 
 def giving_list(items: List[Any]) -> bool:
@@ -33,41 +51,67 @@ def giving_list(items: List[Any]) -> bool:
     if empty_list(items):
         return False
 
-    # Determine the maximum width for each column
-    max_name_len = max(len(getattr(item, 'name', '')) for item in items) + 2
-    max_date_len = max(len(getattr(item, 'formatted_date', 'N/A')) for item in items) + 2
-    number_width = len(str(len(items)))  # This gives the width of the largest number
-
-    # Print the list with alignment
-    for i, thing in enumerate(items, start=1):
-        if isinstance(thing, Habit):
-            periodicity_str = Habit.periodicity_map.get(thing.periodicity, "Unknown")
-            print(f"{str(i).rjust(number_width)}. {thing.name.ljust(max_name_len)} | "
-                  f"{periodicity_str.ljust(7)} | "
-                  f"Decoration: {thing.decoration.name.ljust(max_name_len)} | "
-                  f"Next Completion Date: {thing.formatted_date.ljust(max_date_len)} | "
-                  f"Current Streak: {thing.streak} | "
-                  f"Longest Streak: {thing.longest_streak} | "
-                  f"{thing.fails} Fails")
-        elif isinstance(thing, Decoration):
-            print(f"{str(i).rjust(number_width)}. {thing.name.ljust(max_name_len)} | "
-                  f"{thing.room.ljust(13)} | "
-                  f"{thing.state.ljust(7)} | "
-                  f"{str(thing.exp)} EXP")
-        else:
+    # The lists are never mixed, so pick the formatting once from the first item
+    if isinstance(items[0], Habit):
+        print_habit_list(items)
+    elif isinstance(items[0], Decoration):
+        print_decor_list(items)
+    else:
+        for i, thing in enumerate(items, start=1):
             print(f"{i}. {thing}")  # Default printing for any other object type
 
     return True
 
 
+def print_habit_list(habits: List[Habit]):
+    """Print a numbered, column-aligned table of habits."""
+    # Determine the maximum width for each column in a single pass
+    max_name_len = max_date_len = 0
+    for habit in habits:
+        name_len = len(habit.name)
+        date_len = len(habit.formatted_date)
+        if name_len > max_name_len:
+            max_name_len = name_len
+        if date_len > max_date_len:
+            max_date_len = date_len
+    max_name_len += 2
+    max_date_len += 2
+    number_width = len(str(len(habits)))  # This gives the width of the largest number
+    periodicity_map = Habit.periodicity_map
+
+    # Bake the column widths into the row template once instead of padding every field per row
+    habit_row = (f"{{:>{number_width}}}. {{:<{max_name_len}}} | {{:<7}} | "
+                 f"Decoration: {{:<{max_name_len}}} | "
+                 f"Next Completion Date: {{:<{max_date_len}}} | "
+                 "Current Streak: {} | Longest Streak: {} | {} Fails")
+
+    for i, habit in enumerate(habits, start=1):
+        print(habit_row.format(i, habit.name, periodicity_map.get(habit.periodicity, "Unknown"),
+                               habit.decoration.name, habit.formatted_date,
+                               habit.streak, habit.longest_streak, habit.fails))
+
+
+def print_decor_list(decorations: List[Decoration]):
+    """Print a numbered, column-aligned table of decorations."""
+    max_name_len = max(len(decor.name) for decor in decorations) + 2
+    number_width = len(str(len(decorations)))  # This gives the width of the largest number
+
+    decor_row = f"{{:>{number_width}}}. {{:<{max_name_len}}} | {{:<13}} | {{:<7}} | {{}} EXP"
+
+    for i, decor in enumerate(decorations, start=1):
+        print(decor_row.format(i, decor.name, decor.room, decor.state, decor.exp))
+
+
+# Criteria that are sorted from the highest value down
+DESCENDING_CRITERIA = frozenset(('fails', 'streak', 'l_streak', 'exp'))
+
+
 def filter_items(items: List[Any], criterion: str, criteria_map: Dict[str, Callable[[Any], Any]]) -> List[Any]:
     """Filters and sorts the list of items based on the given criterion."""
     if criterion not in criteria_map:
         raise ValueError("Invalid criterion.")
 
-    reverse = criterion in ['fails', 'streak', 'l_streak', 'exp']  # Reverse order for certain criteria
-
-    return sorted(items, key=criteria_map[criterion], reverse=reverse)
+    return sorted(items, key=criteria_map[criterion], reverse=criterion in DESCENDING_CRITERIA)
 
 
 def filter_items_menu(items: List[Any], criteria_map: Dict[str, Callable[[Any], Any]]):
@@ -98,8 +142,8 @@ def view_items(items: List[Any], criteria_map: Dict[str, Callable[[Any], Any]],
     if action == "check_in" and is_habit:
         print("\nFirst, let's choose what to check-in!")
         choice = choice_check(len(items))
+        saving()  # Mark it before check_in(), as its prompts can return to the main menu
         items[choice - 1].check_in()
-        saving()
         return
 
     while True:
@@ -119,11 +163,11 @@ def view_items(items: List[Any], criteria_map: Dict[str, Callable[[Any], Any]],
         if is_habit and sub_choice == 1:
             if len(items) == 1:
                 # If there's only one habit, directly proceed to edit/delete it
-                edit_habit(items[0])
+                edit_habit(items[0], 0)
             else:
                 print("\nWhat habit are you interested in?")
                 choice = choice_check(len(items))
-                edit_habit(items[choice - 1])
+                edit_habit(items[choice - 1], choice - 1)
         elif (is_habit and sub_choice == 2) or (not is_habit and sub_choice == 1):
             filter_items_menu(items, criteria_map)
         else:
@@ -181,7 +225,7 @@ def get_periodicity() -> int:
 
 def decor_check(decoration: Decoration, habit_objects: List[Habit], current_habit: Optional[Habit] = None) -> bool:
     """Check if the decoration is already linked to another habit."""
-    for habit in habit_objects:
+    for index, habit in enumerate(habit_objects):
         if habit.decoration == decoration and habit != current_habit:
             print(f"\nWARNING: Decoration {decoration.name} is already linked to the habit {habit.name}!"
                   "\nChoosing it will delete the existing habit and EXP, creating a new one.")
@@ -189,7 +233,8 @@ def decor_check(decoration: Decoration, habit_objects: List[Habit], current_habi
                 proceed = input("\nDo you want to proceed? (yes/no): ").strip().lower()
                 if proceed in ['yes', 'no']:
                     if proceed == 'yes':
-                        habit_objects.remove(habit)  # Delete the existing habit
+                        del habit_objects[index]  # Delete the existing habit
+                        saving()
                         print(f"\nThe habit '{habit.name}' has been deleted.")
                     return proceed == 'yes'
                 else:
@@ -198,8 +243,8 @@ def decor_check(decoration: Decoration, habit_objects: List[Habit], current_habi
     return True
 
 
-def edit_habit(habit: Habit) -> None:
-    """Allows the user to edit the habit's information."""
+def edit_habit(habit: Habit, habit_index: int) -> None:
+    """Allows the user to edit the habit's information, given the habit and its index in habit_objects."""
     options = {
         1: "Name",
         2: "Periodicity",
@@ -228,6 +273,7 @@ def edit_habit(habit: Habit) -> None:
 
     elif choice == 3:
         habit.reset_decoration()
+        saving()  # The old decoration is reset even if the user goes back before picking a new one
         print("\nPlease enter the number of the decoration you're interested in.")
         if giving_list(decor_objects):
             decoration_choice = choice_check(len(decor_objects))
@@ -241,7 +287,7 @@ def edit_habit(habit: Habit) -> None:
 
     elif choice == 4:
         habit.reset_decoration()
-        habit_objects.remove(habit)
+        del habit_objects[habit_index]
         print(f"This habit '{habit.name}' was deleted!")
 
     saving()
@@ -266,13 +312,12 @@ def handle_check_in():
     wrapped_message("LET'S CHECK IN!", 30)
     if len(habit_objects) == 1:
         # If there's only one habit, automatically start check-in
+        saving()  # Mark it before check_in(), as its prompts can return to the main menu
         habit_objects[0].check_in()
     else:
         # If there's more than one habit, display the habits and ask for choice
         view_items(habit_objects, Habit.habit_criteria_map, is_habit=True, action="check_in")
 
-    saving()
-
 
 def quotes_and_tips() -> (str, str):
     """
@@ -281,8 +326,8 @@ def quotes_and_tips() -> (str, str):
     Returns:
         tuple: A random quote and a random tip.
     """
-    random_quote = random.choice(quotes) if quotes else "\nNo quotes today. :("
-    random_tip = random.choice(tips) if tips else "\nNo tips today. :("
+    random_quote = quotes[random.randrange(quotes_count)] if quotes_count else "\nNo quotes today. :("
+    random_tip = tips[random.randrange(tips_count)] if tips_count else "\nNo tips today. :("
     return random_quote, random_tip
 
 
@@ -331,6 +376,7 @@ def butler_menu():
 def main_menu():
     """Display the main menu and handle user navigation."""
     while True:
+        save_changes()  # Write whatever changed in the previous menu action
         wrapped_message("MAIN MENU", 50)
         print("Please type valid numbers to navigate the app."
               "\nType X at any point to return back to the main menu.")
@@ -346,40 +392,46 @@ def main_menu():
               "\n7. Talk to the Butler"
               "\n\n== OTHER =="
               "\n8. Exit the app")
-        choice = choice_check(8)
-
-        if choice == 1:
-            handle_check_in()
-        elif choice == 2:
-            create_new_habit()
-        elif choice == 3:
-            if habit_objects:
-                wrapped_message("Here's a list of your habits:", 55)
-            view_items(habit_objects, Habit.habit_criteria_map, is_habit=True)
-        elif choice == 4:
-            delete_habits()
-            type_ok()
-        elif choice == 5:
-            wrapped_message("Here's a list of all the rooms in your palace:", 50)
-            giving_list(Conversion.rooms)
-            type_ok()
-        elif choice == 6:
-            wrapped_message("Here's a list of your decorations:", 55)
-            view_items(decor_objects, Decoration.decor_criteria_map, is_habit=False)
-        elif choice == 7:
-            butler_menu()
-        elif choice == 8:
-            saving()
-            exit()
+        try:
+            choice = choice_check(8)
+
+            if choice == 1:
+                handle_check_in()
+            elif choice == 2:
+                create_new_habit()
+            elif choice == 3:
+                if habit_objects:
+                    wrapped_message("Here's a list of your habits:", 55)
+                view_items(habit_objects, Habit.habit_criteria_map, is_habit=True)
+            elif choice == 4:
+                delete_habits()
+                type_ok()
+            elif choice == 5:
+                wrapped_message("Here's a list of all the rooms in your palace:", 50)
+                giving_list(Conversion.rooms)
+                type_ok()
+            elif choice == 6:
+                wrapped_message("Here's a list of your decorations:", 55)
+                view_items(decor_objects, Decoration.decor_criteria_map, is_habit=False)
+            elif choice == 7:
+                butler_menu()
+            elif choice == 8:
+                save_changes()
+                exit()
+        except ReturnToMainMenu:
+            continue
 
 
 # Initialize lists to keep track of corrupted data and fails
-corrupted_data = []
+corrupted_data = Conversion.corrupted_data
 failed_habits = []
 
 # Load and convert data
 decor_objects = [Conversion.convert_decor(decor) for decor in FileManager.load_data('decorations.json')]
-habit_objects = [Conversion.convert_habit(habit, decor_objects) for habit in FileManager.load_data('habits.json')]
+decor_index = {(decor.name, decor.room, decor.state): decor for decor in decor_objects}
+habit_data = FileManager.load_data('habits.json')
+habit_names = {habit.get('name') for habit in habit_data}
+habit_objects = [Conversion.convert_habit(habit, decor_objects, decor_index, habit_names) for habit in habit_data]
 
 # Load Butler data
 butler_options = FileManager.load_data('butler_options.json')
@@ -387,6 +439,10 @@ current_butler_data = FileManager.load_data('current_butler.json')
 tips = FileManager.load_data('tips.json')
 quotes = FileManager.load_data('quotes.json')
 
+# The quotes and tips never change while the app runs, so count them once for quotes_and_tips()
+quotes_count = len(quotes)
+tips_count = len(tips)
+
 # Initialize Butler object
 butler = None
 if current_butler_data:
@@ -400,12 +456,12 @@ else:
     butler = None  # No Butler yet
 
 # Check for failed habits only if the current time is past the end of the check-in day
+today = datetime.now().date()
 for habit in habit_objects:
     original_fails = habit.fails
-    completion_date_end = habit.next_completion_date.replace(hour=23, minute=59, second=59)
 
-    # Only mark as failed if current time is past the end of the allowed check-in time
-    if datetime.now() > completion_date_end:
+    # Only mark as failed if the whole check-in day is already over
+    if today > habit.next_completion_date.date():
         if habit.calculate_fails() and habit.fails > original_fails:
             failed_habits.append(habit)
 
@@ -415,6 +471,10 @@ for habit in habit_objects:
                 habit.decoration.exp = max(habit.decoration.exp - deduction, 0)
                 habit.decoration.update_state()  # Update the decoration state after deduction
 
+# Repaired or failed habits changed the loaded data, so make sure it gets written
+if corrupted_data or failed_habits:
+    saving()
+
 # Start the app
 print("\nWelcome to the Habit Tracker!")
 
@@ -427,7 +487,12 @@ if failed_habits:
     wrapped_message("Unfortunately, you failed the following habits since the last time: ", 50)
     giving_list(failed_habits)
     print("\nDon't get upset. You got this!")
-    type_ok()
-
-main_menu()
-saving()
+    try:
+        type_ok()
+    except ReturnToMainMenu:
+        pass  # We're about to show the main menu anyway
+
+try:
+    main_menu()
+finally:
+    save_changes()  # Don't lose unsaved changes if the app is interrupted
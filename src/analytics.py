@@ -1,5 +1,5 @@
-from typing import List, Dict, Any
-from functools import reduce
+from typing import List, Dict, Any, Optional, Tuple
+from operator import attrgetter
 
 class Analytics:
     @staticmethod
@@ -13,7 +13,7 @@ class Analytics:
         Returns:
             List[str]: A list of habit names.
         """
-        return list(map(lambda habit: habit.name, habit_objects))
+        return [habit.name for habit in habit_objects]
 
     @staticmethod
     def get_habits_by_periodicity(habit_objects: List, periodicity: int) -> List[str]:
@@ -27,10 +27,26 @@ class Analytics:
         Returns:
             List[str]: A list of habit names with the given periodicity.
         """
-        return list(map(lambda habit: habit.name, filter(lambda habit: habit.periodicity == periodicity, habit_objects)))
+        return [habit.name for habit in habit_objects if habit.periodicity == periodicity]
 
     @staticmethod
-    def get_longest_streak(habit_objects: List) -> str:
+    def get_habits_grouped_by_periodicity(habit_objects: List) -> Dict[int, List[str]]:
+        """
+        Groups the names of all habits by their periodicity in a single pass.
+
+        Args:
+            habit_objects (List[Habit]): The list of habit objects.
+
+        Returns:
+            Dict[int, List[str]]: Habit names keyed by periodicity; periodicities without habits are left out.
+        """
+        grouped_habits = {}
+        for habit in habit_objects:
+            grouped_habits.setdefault(habit.periodicity, []).append(habit.name)
+        return grouped_habits
+
+    @staticmethod
+    def get_longest_streak(habit_objects: List) -> Optional[str]:
         """
         Returns the name of the habit with the longest run streak.
 
@@ -38,11 +54,30 @@ class Analytics:
             habit_objects (List[Habit]): The list of habit objects.
 
         Returns:
-            str: The name of the habit with the longest streak.
+            Optional[str]: The name of the habit with the longest streak, or None if there are no habits.
         """
-        if not habit_objects:
-            return None
-        return max(habit_objects, key=lambda habit: habit.streak, default=None)
+        habit_longest_streak = max(habit_objects, key=attrgetter('streak'), default=None)
+        return habit_longest_streak.name if habit_longest_streak else None
+
+    @staticmethod
+    def get_longest_streaks(habit_objects: List) -> Tuple[Optional[Any], Optional[Any]]:
+        """
+        Returns the habits with the biggest current streak and the biggest streak of all time, in a single pass.
+
+        Args:
+            habit_objects (List[Habit]): The list of habit objects.
+
+        Returns:
+            Tuple[Optional[Habit], Optional[Habit]]: The habit with the longest current streak and the habit
+            with the longest streak of all time, or (None, None) if there are no habits.
+        """
+        current_best = all_time_best = None
+        for habit in habit_objects:
+            if current_best is None or habit.streak > current_best.streak:
+                current_best = habit
+            if all_time_best is None or habit.longest_streak > all_time_best.longest_streak:
+                all_time_best = habit
+        return current_best, all_time_best
 
     @staticmethod
     def get_longest_streak_for_habit(habit_objects: List, habit_name: str) -> int:
@@ -56,7 +91,8 @@ class Analytics:
         Returns:
             int: The longest streak for the given habit, or 0 if the habit is not found.
         """
-        habit = next((habit for habit in habit_objects if habit.name.lower() == habit_name.lower()), None)
+        habit_name = habit_name.lower()
+        habit = next((habit for habit in habit_objects if habit.name.lower() == habit_name), None)
         return habit.longest_streak if habit else 0
 
     @staticmethod
@@ -72,5 +108,5 @@ class Analytics:
         """
         if not habit_objects:
             return "No habits found."
-        habit_most_fails = reduce(lambda x, y: x if x.fails > y.fails else y, habit_objects)
+        habit_most_fails = max(habit_objects, key=attrgetter('fails'))
         return habit_most_fails.name if habit_most_fails.fails > 0 else "No fails were found."
@@ -1,4 +1,4 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple, Set
 import random
 from datetime import datetime
 from models import Habit, Decoration, Butler
@@ -9,6 +9,9 @@ class Conversion:
     rooms = ["Living Room", "Bedroom", "Home Office"]
     decor_names = ["Sofa", "Armchair", "Coffee Table", "Rug", "Pillow"]
 
+    # Descriptions of every habit/decoration that had to be repaired while loading
+    corrupted_data: List[str] = []
+
     @staticmethod
     def serialize_habits(habit_objects: List[Habit]) -> List[Dict[str, Any]]:
         """
@@ -20,23 +23,37 @@ class Conversion:
         Returns:
             List[Dict[str, Any]]: The serialized habit data.
         """
-        serialized_habits = []
-        for habit in habit_objects:
-            habit_dict = habit.__dict__.copy()
-            if habit_dict['next_completion_date']:
-                habit_dict['next_completion_date'] = habit_dict['next_completion_date'].isoformat()
-            if isinstance(habit_dict['decoration'], Decoration):
-                habit_dict['decoration'] = habit_dict['decoration'].__dict__
-            serialized_habits.append(habit_dict)
-        return serialized_habits
+        return [habit.to_json() for habit in habit_objects]
+
+    @staticmethod
+    def fallback_habit_name(taken_names: Set[str]) -> str:
+        """
+        Picks the first "Habit N" name that isn't taken yet and adds it to taken_names.
+
+        Args:
+            taken_names (Set[str]): The habit names already in use.
+
+        Returns:
+            str: The new habit name.
+        """
+        number = 1
+        while f"Habit {number}" in taken_names:
+            number += 1
+        name = f"Habit {number}"
+        taken_names.add(name)
+        return name
 
     @staticmethod
-    def convert_habit(habit_data: Dict[str, Any], decor_objects: List['Decoration']) -> 'Habit':
+    def convert_habit(habit_data: Dict[str, Any], decor_objects: List['Decoration'],
+                      decor_index: Dict[Tuple[str, str, str], 'Decoration'], taken_names: Set[str]) -> 'Habit':
         """
         Converts a dictionary from JSON into a Habit object.
 
         Args:
             habit_data (Dict[str, Any]): The habit data from JSON.
+            decor_objects (List[Decoration]): The loaded decorations, used as a fallback for missing ones.
+            decor_index (Dict[Tuple[str, str, str], Decoration]): The loaded decorations keyed by (name, room, state).
+            taken_names (Set[str]): The names of all loaded habits, so a missing name isn't replaced by a used one.
 
         Returns:
             Habit: The converted Habit object.
@@ -55,7 +72,7 @@ class Conversion:
 
         # Handle missing name
         if 'name' not in habit_data or not habit_data['name']:
-            habit_data['name'] = random.choice(string.ascii_letters)
+            habit_data['name'] = Conversion.fallback_habit_name(taken_names)
             corrupted_fields.append('name')
 
         # Handle missing periodicity
@@ -65,10 +82,8 @@ class Conversion:
 
         # Handle missing decoration
         if 'decoration' in habit_data and isinstance(habit_data['decoration'], dict):
-            matched_decor = next((decor for decor in decor_objects if
-                                  decor.name == habit_data['decoration']['name'] and
-                                  decor.room == habit_data['decoration']['room'] and
-                                  decor.state == habit_data['decoration']['state']), None)
+            decor = habit_data['decoration']
+            matched_decor = decor_index.get((decor.get('name'), decor.get('room'), decor.get('state')))
 
             habit_data['decoration'] = matched_decor if matched_decor else Conversion.convert_decor(habit_data['decoration'])
         else:
@@ -78,7 +93,7 @@ class Conversion:
         current_habit = Habit(**habit_data)
 
         if corrupted_fields:
-            corrupted_data.append(f"Habit '{current_habit.name}': changed fields - {', '.join(corrupted_fields)}")
+            Conversion.corrupted_data.append(f"Habit '{current_habit.name}': changed fields - {', '.join(corrupted_fields)}")
 
         return current_habit
 
@@ -118,6 +133,6 @@ class Conversion:
         decoration = Decoration(**decor_data)
 
         if corrupted_fields:
-            corrupted_data.append(f"Decoration '{decoration.name}': changed fields - {', '.join(corrupted_fields)}")
+            Conversion.corrupted_data.append(f"Decoration '{decoration.name}': changed fields - {', '.join(corrupted_fields)}")
 
         return decoration
@@ -2,6 +2,11 @@ import json
 import logging
 from typing import List, Dict, Any
 
+try:
+    import orjson  # Optional, much faster JSON encoding/decoding
+except ImportError:
+    orjson = None
+
 class FileManager:
     """Handles file operations like loading and saving JSON data."""
 
@@ -21,14 +26,18 @@ class FileManager:
             List[Dict[str, Any]]: The data loaded from the JSON file, or an empty list if an error occurs.
         """
         try:
-            with open(filename, 'r') as file:
-                data = json.load(file)
-                FileManager.logger.info(f"Loaded data from {filename}")
-                return data
+            if orjson:
+                with open(filename, 'rb') as file:
+                    data = orjson.loads(file.read())
+            else:
+                with open(filename, 'r') as file:
+                    data = json.load(file)
+            FileManager.logger.info(f"Loaded data from {filename}")
+            return data
         except FileNotFoundError:
             FileManager.logger.error(f"{filename} not found.")
             return []
-        except json.JSONDecodeError as e:
+        except json.JSONDecodeError as e:  # orjson.JSONDecodeError is a subclass
             FileManager.logger.error(f"Error reading {filename}: {e}")
             return []
 
@@ -42,8 +51,12 @@ class FileManager:
             data (List[Dict[str, Any]]): The data to save.
         """
         try:
-            with open(filename, 'w') as file:
-                json.dump(data, file, indent=4)
-                FileManager.logger.info(f"Saved data to {filename}")
+            if orjson:
+                with open(filename, 'wb') as file:
+                    file.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w') as file:
+                    json.dump(data, file, indent=2)  # Same layout as orjson's OPT_INDENT_2
+            FileManager.logger.info(f"Saved data to {filename}")
         except IOError as e:
             FileManager.logger.error(f"Error writing to {filename}: {e}")
@@ -2,6 +2,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 import random
+from operator import attrgetter
 from utils import get_day_with_suffix, wrapped_message, type_ok, empty_list
 from file_manager import FileManager
 from analytics import Analytics
@@ -17,15 +18,21 @@ class Decoration:
         exp (int): The current experience points of the decoration.
     """
 
+    __slots__ = ('name', 'room', 'state', 'exp')
+
     # EXP thresholds and corresponding states
     exp_states = {0: "Old", 16: "Normal", 32: "Good", 64: "Great"}
 
+    # Thresholds from the highest down, and each state's rank, for update_state
+    exp_thresholds = sorted(exp_states.items(), reverse=True)
+    state_ranks = {state: rank for rank, state in enumerate(exp_states.values())}
+
     # For filtering decorations
     decor_criteria_map = {
-        'name': lambda decor: decor.name,
-        'room': lambda decor: decor.room,
-        'state': lambda decor: decor.state,
-        'exp': lambda decor: decor.exp
+        'name': attrgetter('name'),
+        'room': attrgetter('room'),
+        'state': attrgetter('state'),
+        'exp': attrgetter('exp')
     }
 
     def __init__(self, name: str, room: str, state: str, exp: int):
@@ -37,6 +44,10 @@ class Decoration:
     def __repr__(self) -> str:
         return f"Decoration: {self.name}; Room: {self.room}; State: {self.state}; EXP: {self.exp}"
 
+    def to_json(self) -> Dict[str, Any]:
+        """Returns the decoration's saved fields as a JSON-serializable dictionary."""
+        return {'name': self.name, 'room': self.room, 'state': self.state, 'exp': self.exp}
+
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Decoration):
             return (self.name == other.name and
@@ -47,33 +58,60 @@ class Decoration:
     def __hash__(self) -> int:
         return hash((self.name, self.room, self.state))
 
+    @staticmethod
+    def state_for_exp(exp: float) -> str:
+        """Returns the state a decoration with the given EXP should be in."""
+        for exp_threshold, state in Decoration.exp_thresholds:
+            if exp >= exp_threshold:
+                return state
+        return Decoration.exp_thresholds[-1][1]  # Below every threshold, e.g. corrupted negative EXP
+
     def update_state(self):
         """
         Updates the state of the decoration based on its EXP.
         Logs the change and notifies the user if the state is upgraded or downgraded.
         """
+        new_state = Decoration.state_for_exp(self.exp)
+        if new_state == self.state:
+            return  # Still in the same EXP bracket, the common case after a check-in
+
         previous_state = self.state
+        self.state = new_state
 
-        # Determine the new state based on current EXP
-        for exp_threshold, state in sorted(Decoration.exp_states.items(), reverse=True):
-            if self.exp >= exp_threshold:
-                self.state = state
-                break
-
-        # If the state has changed, log the change and notify the user
-        if self.state != previous_state:
-            FileManager.logger.info(f"The decoration {self.name} was updated to {self.state}.")
-            previous_state_index = list(Decoration.exp_states.values()).index(previous_state)
-            new_state_index = list(Decoration.exp_states.values()).index(self.state)
-
-            if new_state_index > previous_state_index:
-                wrapped_message(f"Congratulations!"
-                                f"\nThe decoration {self.name} was upgraded to {self.state} state!"
-                                f"\nLooks better now!", 70)
-            else:
-                wrapped_message(f"The decoration {self.name} was downgraded to {self.state} state. "
-                                f"\nDon't give up! Keep working to improve it!", 70)
-            return
+        # The state has changed, so log the change and notify the user
+        FileManager.logger.info("The decoration %s was updated to %s.", self.name, self.state)
+        if Decoration.state_ranks[self.state] > Decoration.state_ranks[previous_state]:
+            wrapped_message(f"Congratulations!"
+                            f"\nThe decoration {self.name} was upgraded to {self.state} state!"
+                            f"\nLooks better now!", 70)
+        else:
+            wrapped_message(f"The decoration {self.name} was downgraded to {self.state} state. "
+                            f"\nDon't give up! Keep working to improve it!", 70)
+
+
+# Steps for daily and weekly habits, built once instead of on every increment
+ONE_DAY = timedelta(days=1)
+ONE_WEEK = timedelta(weeks=1)
+
+
+def next_day(date: datetime) -> datetime:
+    """Returns the same time on the following day."""
+    return date + ONE_DAY
+
+
+def next_week(date: datetime) -> datetime:
+    """Returns the same time a week later."""
+    return date + ONE_WEEK
+
+
+def next_month(date: datetime) -> datetime:
+    """Returns the same time in the following month, capping the day at the 28th."""
+    return date.replace(month=(date.month % 12) + 1, year=date.year + (date.month // 12), day=min(date.day, 28))
+
+
+def next_year(date: datetime) -> datetime:
+    """Returns the same time a year later."""
+    return date.replace(year=date.year + 1)
 
 
 class Habit:
@@ -90,21 +128,30 @@ class Habit:
         longest_streak (int): The longest streak of successful completions.
     """
 
+    __slots__ = ('name', 'periodicity', 'decoration', 'next_completion_date', 'fails', 'streak', 'longest_streak',
+                 '_formatted_date')
+
     # EXP values based on periodicity
     exp_values = {1: 1, 2: 8, 3: 16, 4: 32}
 
+    # Length in days of the periodicities that don't depend on the calendar
+    period_days = {1: 1, 2: 7}
+
+    # Functions moving a completion date forward by one period, per periodicity
+    completion_date_steps = {1: next_day, 2: next_week, 3: next_month, 4: next_year}
+
     # Map periodicity numbers to words
     periodicity_map = {1: "Daily", 2: "Weekly", 3: "Monthly", 4: "Yearly"}
 
     # For displaying the habit tables
     habit_criteria_map = {
-        'name': lambda habit: habit.name,
-        'periodicity': lambda habit: habit.periodicity,
-        'room': lambda habit: habit.decoration.room,
-        'next_completion_date': lambda habit: habit.next_completion_date,
-        'fails': lambda habit: habit.fails,
-        'streak': lambda habit: habit.streak,
-        'l_streak': lambda habit: habit.longest_streak
+        'name': attrgetter('name'),
+        'periodicity': attrgetter('periodicity'),
+        'room': attrgetter('decoration.room'),
+        'next_completion_date': attrgetter('next_completion_date'),
+        'fails': attrgetter('fails'),
+        'streak': attrgetter('streak'),
+        'l_streak': attrgetter('longest_streak')
     }
 
     def __init__(self, name: str, periodicity: int, decoration: Decoration,
@@ -116,36 +163,67 @@ class Habit:
         self.fails = fails
         self.streak = streak
         self.longest_streak = longest_streak
+        self._formatted_date = (None, None, "N/A")  # (date, periodicity, text) of the last formatting
 
     def __repr__(self) -> str:
         return (f"Habit: {self.name}; Periodicity: {self.periodicity}; "
                 f"Decoration: {self.decoration.name}; Room: {self.decoration.room}; "
                 f"Check-in Day: {self.formatted_date}; Fails: {self.fails}; Streak: {self.streak}")
 
+    def to_json(self) -> Dict[str, Any]:
+        """Returns the habit's saved fields as a JSON-serializable dictionary, leaving out cached values."""
+        return {'name': self.name,
+                'periodicity': self.periodicity,
+                'decoration': self.decoration.to_json() if isinstance(self.decoration, Decoration) else self.decoration,
+                'next_completion_date': self.next_completion_date.isoformat() if self.next_completion_date else None,
+                'fails': self.fails,
+                'streak': self.streak,
+                'longest_streak': self.longest_streak}
+
     @property
     def formatted_date(self) -> str:
-        """Returns the formatted next completion date."""
+        """Returns the formatted next completion date, reformatting only when the date or periodicity changed."""
+        # datetimes are immutable and every reassignment creates a new one, so identity is enough here
+        date, periodicity, text = self._formatted_date
+        if date is self.next_completion_date and periodicity == self.periodicity:
+            return text
+
         if self.next_completion_date:
             day_with_suffix = get_day_with_suffix(self.next_completion_date.day)
-            return self.next_completion_date.strftime(f"%B {day_with_suffix}, %Y" if self.periodicity == 4 else f"%B {day_with_suffix}")
-        return "N/A"
+            text = self.next_completion_date.strftime(f"%B {day_with_suffix}, %Y" if self.periodicity == 4 else f"%B {day_with_suffix}")
+        else:
+            text = "N/A"
+        self._formatted_date = (self.next_completion_date, self.periodicity, text)
+        return text
 
     def increment_completion_date(self, date: datetime) -> datetime:
         """Increments the provided date by the habit's periodicity."""
-        if self.periodicity == 1:  # Daily
-            return date + timedelta(days=1)
-        elif self.periodicity == 2:  # Weekly
-            return date + timedelta(weeks=1)
-        elif self.periodicity == 3:  # Monthly
-            return date.replace(month=(date.month % 12) + 1, year=date.year + (date.month // 12), day=min(date.day, 28))
-        elif self.periodicity == 4:  # Yearly
-            return date.replace(year=date.year + 1)
-        raise ValueError("Invalid periodicity value.")
+        step = Habit.completion_date_steps.get(self.periodicity)
+        if step is None:
+            raise ValueError("Invalid periodicity value.")
+        return step(date)
 
     def calculate_completion_date(self) -> datetime:
         """Calculates the next completion date based on the habit's periodicity."""
         return self.increment_completion_date(datetime.now())
 
+    @staticmethod
+    def count_missed_periods(now_ordinal: int, due_ordinal: int, period_days: int) -> int:
+        """
+        Counts how many periods of a fixed length have been missed.
+
+        Args:
+            now_ordinal (int): Today's proleptic Gregorian ordinal.
+            due_ordinal (int): The ordinal of the day the habit was due.
+            period_days (int): The length of one period in days.
+
+        Returns:
+            int: The number of periods to skip so the due day is today or later.
+        """
+        if now_ordinal <= due_ordinal:
+            return 0
+        return -(-(now_ordinal - due_ordinal) // period_days)  # Ceiling division
+
     def calculate_fails(self) -> bool:
         """
         Calculates the number of fails based on the original next completion date and the current date.
@@ -153,13 +231,22 @@ class Habit:
         Returns:
             bool: True if fails were detected, False otherwise.
         """
-        now = datetime.now()
+        now_ordinal = datetime.now().toordinal()  # A habit is failed once its whole due day is over
         fails_detected = False
 
-        while now > self.next_completion_date.replace(hour=23, minute=59, second=59):
-            self.next_completion_date = self.increment_completion_date(self.next_completion_date)
-            self.fails += 1
-            fails_detected = True
+        if self.periodicity in Habit.period_days:
+            # Fixed-length periods: work out every missed period at once instead of stepping through them
+            period_days = Habit.period_days[self.periodicity]
+            missed = Habit.count_missed_periods(now_ordinal, self.next_completion_date.toordinal(), period_days)
+            if missed:
+                self.next_completion_date += timedelta(days=missed * period_days)
+                self.fails += missed
+                fails_detected = True
+        else:
+            while now_ordinal > self.next_completion_date.toordinal():
+                self.next_completion_date = self.increment_completion_date(self.next_completion_date)
+                self.fails += 1
+                fails_detected = True
 
         if fails_detected:
             # Update longest streak if current streak is greater
@@ -176,29 +263,29 @@ class Habit:
         Returns:
             bool: True if check-in was successful, False otherwise.
         """
-        now = datetime.now()
-        completion_date_start = self.next_completion_date.replace(hour=0, minute=0, second=0)
-        completion_date_end = self.next_completion_date.replace(hour=23, minute=59, second=59)
+        # Check-ins are allowed at any time during the calendar day of the next completion date
+        now_ordinal = datetime.now().toordinal()
+        completion_ordinal = self.next_completion_date.toordinal()
 
-        if now < completion_date_start:
+        if now_ordinal < completion_ordinal:
             day_with_suffix = get_day_with_suffix(self.next_completion_date.day)
             formatted_date = self.next_completion_date.strftime(f"%B {day_with_suffix}")
-            FileManager.logger.warning(f"Attempted early check-in for {self.name}.")
+            FileManager.logger.warning("Attempted early check-in for %s.", self.name)
             wrapped_message(f"It's too early to check-in for {self.name}!"
                             f"\nPlease try again during this day: {formatted_date}.", 50)
             type_ok()
             return False
 
-        if completion_date_start <= now <= completion_date_end:
+        if now_ordinal == completion_ordinal:
             self.streak += 1
             self.decoration.exp += self.exp_values.get(self.periodicity, 0)
-            FileManager.logger.info(f"Successfully checked in for {self.name}. "
-                                    f"Streak: {self.streak}, EXP: {self.decoration.exp}.")
+            FileManager.logger.info("Successfully checked in for %s. Streak: %s, EXP: %s.",
+                                    self.name, self.streak, self.decoration.exp)
 
             self.decoration.update_state()
 
             self.next_completion_date = self.increment_completion_date(self.next_completion_date)
-            FileManager.logger.debug(f"Next completion date for {self.name} set to {self.next_completion_date}.")
+            FileManager.logger.debug("Next completion date for %s set to %s.", self.name, self.next_completion_date)
             if self.streak > self.longest_streak:
                 self.longest_streak = self.streak
                 wrapped_message(f"Successfully checked in for {self.name}!"
@@ -219,7 +306,7 @@ class Habit:
         """Resets the decoration associated with this habit."""
         self.decoration.exp = 0
         self.decoration.state = "Old"
-        FileManager.logger.info(f"Decoration '{self.decoration.name}' linked to habit '{self.name}' was reset.")
+        FileManager.logger.info("Decoration '%s' linked to habit '%s' was reset.", self.decoration.name, self.name)
         print(f"The decoration '{self.decoration.name}' linked to habit '{self.name}' was reset and is now free!")
 
 
@@ -235,6 +322,11 @@ class Butler:
         description (str): The description of the Butler's personality.
     """
 
+    __slots__ = ('name', 'age', 'appearance', 'personality_flag', 'description')
+
+    # (personalities dict, its flags) from the last generate_butler call, so the flags aren't listed on every hire
+    personality_flags_cache = (None, ())
+
     def __init__(self, name: str, age: int, appearance: str, personality_flag: str, description: str):
         self.name = name
         self.age = age
@@ -246,6 +338,11 @@ class Butler:
         return (f"Butler: {self.name}; Age: {self.age}; Appearance: {self.appearance}; "
                 f"Personality: {self.description}")
 
+    def to_json(self) -> Dict[str, Any]:
+        """Returns the Butler's saved fields as a JSON-serializable dictionary."""
+        return {'name': self.name, 'age': self.age, 'appearance': self.appearance,
+                'personality_flag': self.personality_flag, 'description': self.description}
+
     @staticmethod
     def generate_butler(butler_options: Dict[str, Any]) -> 'Butler':
         """
@@ -260,13 +357,18 @@ class Butler:
         name = random.choice(butler_options['names'])
         age = random.randint(21, 112)
         appearance = random.choice(butler_options['appearances'])
-        personality_flag = random.choice(list(butler_options['personalities'].keys()))
-        description = butler_options['personalities'][personality_flag]['description']
+        personalities = butler_options['personalities']
+        cached_personalities, personality_flags = Butler.personality_flags_cache
+        if cached_personalities is not personalities:
+            personality_flags = tuple(personalities)
+            Butler.personality_flags_cache = (personalities, personality_flags)
+        personality_flag = random.choice(personality_flags)
+        description = personalities[personality_flag]['description']
 
         new_butler = Butler(name, age, appearance, personality_flag, description)
 
         # Save the new butler to current_butler.json as a dictionary
-        FileManager.save_data('current_butler.json', new_butler.__dict__)
+        FileManager.save_data('current_butler.json', new_butler.to_json())
         new_butler.display_info()
 
         return new_butler
@@ -306,20 +408,15 @@ class Butler:
         all_habits = Analytics.get_all_habits(habit_objects)
         print(f"Your current habits are: {', '.join(all_habits)}")
 
+        habits_by_period = Analytics.get_habits_grouped_by_periodicity(habit_objects)
         periodicities = ['Daily', 'Weekly', 'Monthly', 'Yearly']
         for i, period in enumerate(periodicities, start=1):
-            habits_by_period = Analytics.get_habits_by_periodicity(habit_objects, i)
-            print(f"{period}: {', '.join(habits_by_period)}")
-
-        longest_streak_habit = Analytics.get_longest_streak(habit_objects)
-        if longest_streak_habit:
-            print(
-                f"Your current biggest streak is {longest_streak_habit.streak} of the habit {longest_streak_habit.name}!")
+            print(f"{period}: {', '.join(habits_by_period.get(i, []))}")
 
-        longest_streak_all_time = Analytics.get_longest_streak(habit_objects)  # Use the appropriate method here
-        if longest_streak_all_time:
-            print(
-                f"Your biggest streak of all time is {longest_streak_all_time.streak} of the habit {longest_streak_all_time.name}!")
+        longest_streak_habit, longest_streak_all_time = Analytics.get_longest_streaks(habit_objects)
+        print(f"Your current biggest streak is {longest_streak_habit.streak} of the habit {longest_streak_habit.name}!")
+        print(f"Your biggest streak of all time is {longest_streak_all_time.longest_streak} "
+              f"of the habit {longest_streak_all_time.name}!")
 
         most_failed_habit = Analytics.get_most_failed_habit(habit_objects)
         if most_failed_habit:
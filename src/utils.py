@@ -1,31 +1,39 @@
 import builtins
-from typing import List, Dict, Any, Callable
+from typing import Dict, Any, Callable, Sequence
 from file_manager import FileManager
 
+# Every spelling of "OK" accepted by type_ok(), so the answer doesn't need upper-casing
+OK_ANSWERS = frozenset(("OK", "Ok", "oK", "ok"))
+
+
 def type_ok():
     """Prompts the user to type 'OK' to continue."""
-    while True:
-        choice = input("\nType 'OK' to continue: ").strip().upper()
-        if choice == "OK":
-            break
-        else:
-            print("\nDude, come on. Type OK to continue.")
+    while input("\nType 'OK' to continue: ").strip() not in OK_ANSWERS:
+        print("\nDude, come on. Type OK to continue.")
+
+
+# Lines of '=' already built by wrapped_message(), keyed by width; only a handful of widths are used
+BANNERS: Dict[int, str] = {}
 
 
 def wrapped_message(message: str, width: int = 30):
     """Prints a message wrapped in lines of '='."""
-    print("\n" + "=" * width)
+    banner = BANNERS.get(width)
+    if banner is None:
+        banner = BANNERS[width] = "=" * width
+    print("\n" + banner)
     print(message.center(width))  # Center the message within the wrapper
-    print("=" * width)
+    print(banner)
+
+
+# Suffix for every possible day of the month, indexed by the day itself (index 0 is unused)
+DAY_SUFFIXES = tuple('th' if 11 <= day <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+                     for day in range(32))
 
 
 def get_day_with_suffix(day: int) -> str:
     """Returns the day of the month with the appropriate suffix."""
-    if 11 <= day <= 13:
-        suffix = 'th'
-    else:
-        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
-    return f"{day}{suffix}"
+    return f"{day}{DAY_SUFFIXES[day]}"
 
 
 def choice_check(number: int) -> int:
@@ -43,9 +51,9 @@ def choice_check(number: int) -> int:
             print(f"Invalid input. Please enter a number between 1 and {number}.")
 
 
-def empty_list(current_list: List[Any]) -> bool:
+def empty_list(current_list: Sequence[Any]) -> bool:
     """Check if the list is empty and print a message if it is."""
-    if not current_list:
-        wrapped_message("Sorry, but this list is empty! Returning...", 50)
-        return True
-    return False
+    if current_list:
+        return False
+    wrapped_message("Sorry, but this list is empty! Returning...", 50)
+    return True
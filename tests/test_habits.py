@@ -2,6 +2,7 @@ import unittest
 from datetime import datetime, timedelta
 from models import Habit, Decoration
 from analytics import Analytics
+from conversion import Conversion
 
 
 class TestHabitOperations(unittest.TestCase):
@@ -16,6 +17,10 @@ class TestHabitOperations(unittest.TestCase):
         self.assertEqual(self.habit.streak, 4)
         self.assertEqual(self.habit.longest_streak, 7)
 
+    def test_habit_default_completion_date(self):
+        # Habits created without a date are due one period from now
+        self.assertEqual(self.habit.next_completion_date.date(), (datetime.now() + timedelta(days=1)).date())
+
     def test_habit_editing(self):
         self.habit.name = "jogging"
         self.habit.periodicity = 2
@@ -40,6 +45,37 @@ class TestHabitOperations(unittest.TestCase):
         self.assertEqual(self.habit.streak, 0)  # Streak should reset
         self.assertEqual(self.habit.longest_streak, 7)  # Longest streak should remain the same
 
+    def test_habit_fail_long_overdue(self):
+        self.habit.periodicity = 2
+        self.habit.next_completion_date = datetime.now() - timedelta(days=20)  # Three missed weeks
+        self.assertTrue(self.habit.calculate_fails())
+        self.assertEqual(self.habit.fails, 3)
+        self.assertEqual(self.habit.next_completion_date.date(), (datetime.now() + timedelta(days=1)).date())
+
+    def test_habit_formatted_date(self):
+        self.habit.next_completion_date = datetime(2024, 9, 1)
+        self.assertEqual(self.habit.formatted_date, "September 1st")
+        self.habit.next_completion_date = datetime(2024, 9, 12)
+        self.assertEqual(self.habit.formatted_date, "September 12th")  # Date change should be picked up
+        self.habit.periodicity = 4
+        self.assertEqual(self.habit.formatted_date, "September 12th, 2024")  # Yearly habits show the year
+
+    def test_decoration_update_state(self):
+        self.decoration.exp = 40
+        self.decoration.update_state()
+        self.assertEqual(self.decoration.state, "Good")
+        self.decoration.exp = 12
+        self.decoration.update_state()
+        self.assertEqual(self.decoration.state, "Old")
+
+    def test_habit_to_json(self):
+        self.habit.next_completion_date = datetime(2024, 9, 1, 12, 30)
+        self.habit.formatted_date  # Fill the formatting cache, which must not be saved
+        self.assertEqual(self.habit.to_json(), {
+            'name': "running", 'periodicity': 1,
+            'decoration': {'name': "Couch", 'room': "Living Room", 'state': "Old", 'exp': 5},
+            'next_completion_date': "2024-09-01T12:30:00", 'fails': 0, 'streak': 4, 'longest_streak': 7})
+
 
 class TestAnalytics(unittest.TestCase):
     def setUp(self):
@@ -65,10 +101,25 @@ class TestAnalytics(unittest.TestCase):
         weekly_habits = Analytics.get_habits_by_periodicity(self.habit_objects, 2)
         self.assertEqual(weekly_habits, ["washing the sheets"])
 
+    def test_get_habits_grouped_by_periodicity(self):
+        grouped_habits = Analytics.get_habits_grouped_by_periodicity(self.habit_objects)
+        self.assertEqual(grouped_habits, {1: ["running", "reading"], 2: ["washing the sheets"]})
+
     def test_get_longest_streak(self):
         longest_streak_habit = Analytics.get_longest_streak(self.habit_objects)
-        self.assertEqual(longest_streak_habit.name, "running")
-        self.assertEqual(longest_streak_habit.longest_streak, 7)
+        self.assertEqual(longest_streak_habit, "running")
+        self.assertIsNone(Analytics.get_longest_streak([]))
+
+    def test_get_longest_streaks(self):
+        self.habit2.streak = 6
+        current_best, all_time_best = Analytics.get_longest_streaks(self.habit_objects)
+        self.assertEqual(current_best.name, "reading")
+        self.assertEqual(all_time_best.name, "running")
+        self.assertEqual(Analytics.get_longest_streaks([]), (None, None))
+
+    def test_get_longest_streak_for_habit(self):
+        self.assertEqual(Analytics.get_longest_streak_for_habit(self.habit_objects, "Reading"), 5)
+        self.assertEqual(Analytics.get_longest_streak_for_habit(self.habit_objects, "swimming"), 0)
 
     def test_get_most_failed_habit(self):
         self.habit1.fails = 10
@@ -78,5 +129,32 @@ class TestAnalytics(unittest.TestCase):
         most_failed_habit = Analytics.get_most_failed_habit(self.habit_objects)
         self.assertEqual(most_failed_habit, "running")
 
+
+class TestConversion(unittest.TestCase):
+    def setUp(self):
+        # corrupted_data is shared by the whole app, so keep each test's entries to itself
+        self.saved_corrupted_data = Conversion.corrupted_data[:]
+        Conversion.corrupted_data.clear()
+
+    def tearDown(self):
+        Conversion.corrupted_data[:] = self.saved_corrupted_data
+
+    def test_convert_corrupted_habit(self):
+        decoration = Decoration(name="Couch", room="Living Room", state="Old", exp=5)
+        habit_data = {'periodicity': 2, 'decoration': {'name': "Couch", 'room': "Living Room", 'state': "Old"}}
+        habit = Conversion.convert_habit(habit_data, [decoration], {("Couch", "Living Room", "Old"): decoration}, set())
+        self.assertEqual(habit.name, "Habit 1")  # A missing name gets a fallback one
+        self.assertIs(habit.decoration, decoration)
+        self.assertEqual(Conversion.corrupted_data,
+                         [f"Habit '{habit.name}': changed fields - next_completion_date, name"])
+
+    def test_convert_nameless_habit_skips_taken_names(self):
+        decoration = Decoration(name="Couch", room="Living Room", state="Old", exp=5)
+        taken_names = {"Habit 1", "reading"}
+        habits = [Conversion.convert_habit({'periodicity': 1, 'decoration': None}, [decoration], {}, taken_names)
+                  for _ in range(2)]
+        self.assertEqual([habit.name for habit in habits], ["Habit 2", "Habit 3"])
+
+
 if __name__ == '__main__':
     unittest.main()